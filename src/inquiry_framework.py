@@ -10,15 +10,15 @@ Version: 1.0.0
 License: MIT
 """
 
-import json
-import datetime
-from typing import List, Dict, Any, Optional, NamedTuple, Tuple
-from dataclasses import dataclass
-from enum import Enum
-import random
+import sys
+import time
+import functools
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, NamedTuple, Tuple, Sequence, Mapping, ClassVar
+from dataclasses import dataclass, replace, fields, is_dataclass
+from enum import Enum, IntEnum
 
-
-class InquiryDepth(Enum):
+class InquiryDepth(str, Enum):
     """Levels of inquiry depth"""
     SURFACE = "surface"
     ANALYTICAL = "analytical"
@@ -26,7 +26,7 @@ class InquiryDepth(Enum):
     EMERGENT = "emergent"
 
 
-class QuestionType(Enum):
+class QuestionType(str, Enum):
     """Types of transformative questions"""
     ESSENTIAL = "essential"
     DIALECTICAL = "dialectical"
@@ -36,7 +36,7 @@ class QuestionType(Enum):
     PRACTICAL = "practical"
 
 
-class LearningContext(Enum):
+class LearningContext(str, Enum):
     """Contexts for inquiry-based learning"""
     PERSONAL = "personal"
     EDUCATIONAL = "educational"
@@ -45,36 +45,119 @@ class LearningContext(Enum):
     RESEARCH = "research"
 
 
-@dataclass
+class ReadinessLevel(IntEnum):
+    """Learner readiness levels for pathway design"""
+    BEGINNER = 0
+    INTERMEDIATE = 1
+    ADVANCED = 2
+
+
+@dataclass(slots=True, frozen=True)
 class Question:
     """Structure for a transformative question"""
     text: str
     question_type: QuestionType
     depth_level: InquiryDepth
     context: str
-    follow_ups: List[str]
+    follow_ups: Sequence[str]
     reasoning: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Perspective:
     """Structure for a stakeholder perspective"""
     stakeholder: str
     viewpoint: str
-    concerns: List[str]
-    opportunities: List[str]
-    questions: List[str]
+    concerns: Sequence[str]
+    opportunities: Sequence[str]
+    questions: Sequence[str]
 
 
-class InquirySequenceResult(NamedTuple):
-    """Result structure for inquiry sequence generation"""
-    topic: str
-    essential_questions: List[Question]
-    dialectical_pairs: List[Tuple[Question, Question]]
-    synthesis_questions: List[Question]
-    practical_applications: List[Question]
-    learning_pathway: List[str]
-    depth_progression: Dict[str, List[Question]]
+class InquirySequenceResult:
+    """
+    Result structure for inquiry sequence generation.
+    Each question group is generated on first access and then cached, so
+    callers only pay for the parts of the sequence they actually read.
+    """
+    
+    _fields = ('topic', 'essential_questions', 'dialectical_pairs', 'synthesis_questions',
+               'practical_applications', 'learning_pathway', 'depth_progression')
+    
+    def __init__(self, generator: 'InquiryGenerator', topic: str, context: LearningContext, depth: int):
+        self._topic = topic
+        self._generator = generator
+        self._context = context
+        self._depth = depth
+    
+    @property
+    def topic(self) -> str:
+        return self._topic
+    
+    # Results are shared through the sequence cache and history, so every
+    # public field is read-only; cached_property fills __dict__ directly
+    def __setattr__(self, name: str, value: Any):
+        if name in self._fields:
+            raise AttributeError(f"{type(self).__name__}.{name} is read-only")
+        object.__setattr__(self, name, value)
+    
+    def __delattr__(self, name: str):
+        if name in self._fields:
+            raise AttributeError(f"{type(self).__name__}.{name} is read-only")
+        object.__delattr__(self, name)
+    
+    @functools.cached_property
+    def essential_questions(self) -> Tuple[Question, ...]:
+        return tuple(self._generator._generate_essential_questions(self.topic, self._context, self._depth))
+    
+    @functools.cached_property
+    def dialectical_pairs(self) -> Tuple[Tuple[Question, Question], ...]:
+        return tuple(self._generator._generate_dialectical_pairs(self.topic, self._context, self._depth))
+    
+    @functools.cached_property
+    def synthesis_questions(self) -> Tuple[Question, ...]:
+        return tuple(self._generator._generate_synthesis_questions(
+            self.topic, self.essential_questions, self.dialectical_pairs))
+    
+    @functools.cached_property
+    def practical_applications(self) -> Tuple[Question, ...]:
+        return tuple(self._generator._generate_practical_questions(self.topic, self._context, self._depth))
+    
+    @functools.cached_property
+    def learning_pathway(self) -> Sequence[str]:
+        return self._generator._design_learning_pathway(
+            self.essential_questions, self.dialectical_pairs, self.synthesis_questions)
+    
+    @functools.cached_property
+    def depth_progression(self) -> Mapping[str, Tuple[Question, ...]]:
+        progression = self._generator._create_depth_progression(self.topic, self._context, self._depth)
+        return MappingProxyType({level: tuple(questions) for level, questions in progression.items()})
+    
+    def _asdict(self) -> Dict[str, Any]:
+        """Return all fields as a dict, generating any that have not been accessed yet"""
+        return {name: getattr(self, name) for name in self._fields}
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle the generated fields rather than the generator that made them
+        self._asdict()
+        state = dict(self.__dict__)
+        state['_generator'] = None
+        state['depth_progression'] = dict(state['depth_progression'])
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self.__dict__['depth_progression'] = MappingProxyType(state['depth_progression'])
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, InquirySequenceResult):
+            return NotImplemented
+        return self is other or self._asdict() == other._asdict()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return (f"InquirySequenceResult(topic={self.topic!r}, context={self._context.value!r}, "
+                f"depth={self._depth})")
 
 
 class PerspectiveRotationResult(NamedTuple):
@@ -83,23 +166,642 @@ class PerspectiveRotationResult(NamedTuple):
     perspectives: List[Perspective]
     synthesis_insights: List[str]
     bridging_questions: List[Question]
-    collaborative_opportunities: List[str]
-    potential_conflicts: List[str]
+    collaborative_opportunities: Sequence[str]
+    potential_conflicts: Sequence[str]
+
+
+def _interned(*strings: str) -> Tuple[str, ...]:
+    """Intern constant strings that end up in generated results and history"""
+    return tuple(sys.intern(string) for string in strings)
+
+
+# Question templates are `str.format` strings with a `{topic}` placeholder.
+# They are built once at import time and shared across generator calls.
+_ESSENTIAL_TEMPLATES = (
+    "What is the fundamental nature of {topic}?",
+    "Why does {topic} matter in our current context?",
+    "How does {topic} challenge our existing assumptions?",
+    "What would change if we fully understood {topic}?",
+    "What questions does {topic} raise that we haven't considered?"
+)
+
+_ESSENTIAL_FOLLOW_UPS = _interned(
+    "How does this connect to your personal experience?",
+    "What evidence supports or challenges this perspective?",
+    "What would someone from a different background think?"
+)
+
+_DIALECTICAL_THEMES = (
+    ("individual", "collective"),
+    ("tradition", "innovation"),
+    ("efficiency", "equity"),
+    ("freedom", "responsibility"),
+    ("local", "global")
+)
+
+# Follow-ups depend only on the theme, so each theme's tuple is built once
+_DIALECTICAL_FOLLOW_UP_TEMPLATES = (
+    "What evidence supports this {theme} perspective?",
+    "Who benefits most from this {theme} approach?",
+    "What are the limitations of focusing solely on {theme} aspects?"
+)
+
+_DIALECTICAL_FOLLOW_UPS = {
+    theme: _interned(*(template.format(theme=theme) for template in _DIALECTICAL_FOLLOW_UP_TEMPLATES))
+    for pair in _DIALECTICAL_THEMES
+    for theme in pair
+}
+
+_PERSONAL_PRACTICAL_TEMPLATES = (
+    "How can I apply insights about {topic} in my daily life?",
+    "What changes would I need to make to align with my understanding of {topic}?",
+    "How can I continue learning about {topic} in meaningful ways?"
+)
+
+_EDUCATIONAL_PRACTICAL_TEMPLATES = (
+    "How can we design learning experiences that help others understand {topic}?",
+    "What assessment methods would capture deep understanding of {topic}?",
+    "How can we make {topic} relevant and engaging for diverse learners?"
+)
+
+_ORGANIZATIONAL_PRACTICAL_TEMPLATES = (
+    "How can our organization implement insights about {topic}?",
+    "What systems and structures need to change to support {topic}?",
+    "How can we measure progress and impact related to {topic}?"
+)
+
+_SOCIAL_PRACTICAL_TEMPLATES = (
+    "How can communities work together to address {topic}?",
+    "What policies and practices would support positive change around {topic}?",
+    "How can we engage diverse stakeholders in conversations about {topic}?"
+)
+
+_RESEARCH_PRACTICAL_TEMPLATES = (
+    "What research questions about {topic} remain unexplored?",
+    "How can we study {topic} in ways that honor its complexity?",
+    "What methodologies would best capture the nuances of {topic}?"
+)
+
+_PRACTICAL_FOLLOW_UPS = _interned(
+    "What would be the first step?",
+    "What resources and support would be needed?",
+    "How would we know if we're making progress?"
+)
+
+# Question prototypes with the fields shared by every question in a
+# category bound up front; generators supply only the per-call fields
+_ESSENTIAL_PROTOTYPE = functools.partial(
+    Question,
+    question_type=QuestionType.ESSENTIAL,
+    depth_level=InquiryDepth.ANALYTICAL,
+    follow_ups=_ESSENTIAL_FOLLOW_UPS
+)
+
+_DIALECTICAL_PROTOTYPE = functools.partial(
+    Question,
+    question_type=QuestionType.DIALECTICAL,
+    depth_level=InquiryDepth.ANALYTICAL
+)
+
+_PRACTICAL_PROTOTYPE = functools.partial(
+    Question,
+    question_type=QuestionType.PRACTICAL,
+    depth_level=InquiryDepth.ANALYTICAL,
+    follow_ups=_PRACTICAL_FOLLOW_UPS
+)
+
+# Context-specific stakeholder types
+_STAKEHOLDER_SETS = {
+    LearningContext.EDUCATIONAL: _interned(
+        "students", "teachers", "administrators", "parents", "community members", 
+        "policymakers", "researchers", "industry partners"
+    ),
+    LearningContext.ORGANIZATIONAL: _interned(
+        "employees", "managers", "customers", "shareholders", "competitors",
+        "regulators", "communities", "suppliers"
+    ),
+    LearningContext.SOCIAL: _interned(
+        "citizens", "government", "activists", "businesses", "media",
+        "researchers", "international observers", "future generations"
+    ),
+    LearningContext.PERSONAL: _interned(
+        "current self", "future self", "family", "friends", "mentors",
+        "critics", "strangers", "cultural background"
+    ),
+    LearningContext.RESEARCH: _interned(
+        "researchers", "participants", "funders", "peer reviewers", "practitioners",
+        "policymakers", "affected communities", "skeptics"
+    )
+}
+
+# Stakeholder templates exposed as PerspectiveRotator.stakeholder_templates
+_STAKEHOLDER_TEMPLATES = MappingProxyType({
+    'universal': _interned(
+        "current self", "future self", "family", "community", "society",
+        "environment", "future generations", "global perspective"
+    ),
+    'organizational': _interned(
+        "employees", "customers", "shareholders", "management", "competitors",
+        "suppliers", "regulators", "community"
+    ),
+    'educational': _interned(
+        "students", "teachers", "parents", "administrators", "community",
+        "employers", "policymakers", "researchers"
+    )
+})
+
+_LEARNING_PATHWAY_STEPS = _interned(
+    "Begin with personal reflection on essential questions",
+    "Explore multiple perspectives through dialectical inquiry",
+    "Engage in dialogue with others holding different viewpoints",
+    "Seek synthesis and integration of diverse perspectives",
+    "Apply insights through practical experimentation",
+    "Reflect on learning and identify next questions",
+    "Share insights with learning community",
+    "Iterate and deepen understanding"
+)
+
+_SYNTHESIS_INSIGHT_TEMPLATES = (
+    "Multiple stakeholders share common concerns about transparency and fairness in {topic}",
+    "Different perspectives reveal complementary rather than competing interests in {topic}",
+    "Successful implementation of {topic} requires addressing diverse stakeholder needs simultaneously",
+    "The complexity of {topic} becomes clearer when viewed through multiple lenses",
+    "Creative solutions emerge when we consider how {topic} can serve multiple stakeholder groups"
+)
+
+_COLLABORATION_OPPORTUNITIES = _interned(
+    "Shared learning initiatives where stakeholders educate each other",
+    "Joint problem-solving sessions focused on common challenges",
+    "Collaborative pilot projects that test solutions together",
+    "Cross-stakeholder advisory groups for ongoing dialogue",
+    "Resource sharing arrangements that benefit multiple groups"
+)
+
+_POTENTIAL_CONFLICTS = _interned(
+    "Resource allocation priorities may differ significantly between groups",
+    "Timeline preferences may conflict between stakeholders with different urgencies",
+    "Risk tolerance levels vary substantially across stakeholder groups",
+    "Cultural values and approaches to change may clash",
+    "Information sharing preferences may create transparency tensions"
+)
+
+# Perspective templates use `{stakeholder}` and `{topic}` placeholders
+_PERSPECTIVE_TEMPLATES = {
+    'viewpoint': "From a {stakeholder} perspective, {topic} represents both opportunities and challenges for our interests and values.",
+    'concerns': (
+        "How will {topic} affect our core interests?",
+        "What risks does {topic} pose to our wellbeing?",
+        "How can we have a voice in decisions about {topic}?"
+    ),
+    'opportunities': (
+        "How can {topic} advance our goals?",
+        "What new possibilities does {topic} create?",
+        "How can we contribute positively to {topic}?"
+    ),
+    'questions': (
+        "What would {stakeholder} most want to know about {topic}?",
+        "What would {stakeholder} most fear about {topic}?",
+        "What would {stakeholder} most hope for regarding {topic}?"
+    )
+}
+
+
+_BASE_STAGES = (
+    MappingProxyType({
+        'name': 'Exploration and Orientation',
+        'focus': 'Understanding the landscape and developing initial questions',
+        'activities': (
+            'Personal reflection on existing knowledge and experiences',
+            'Exploration of diverse perspectives and approaches',
+            'Generation of initial questions and learning goals'
+        ),
+        'duration': '1-2 weeks'
+    }),
+    MappingProxyType({
+        'name': 'Deep Inquiry and Analysis',
+        'focus': 'Systematic investigation through structured questioning',
+        'activities': (
+            'Dialectical exploration of different viewpoints',
+            'Research and evidence gathering',
+            'Dialogue with experts and peers'
+        ),
+        'duration': '2-3 weeks'
+    }),
+    MappingProxyType({
+        'name': 'Synthesis and Integration',
+        'focus': 'Connecting insights and developing understanding',
+        'activities': (
+            'Pattern recognition and connection making',
+            'Integration of multiple perspectives',
+            'Development of personal frameworks and models'
+        ),
+        'duration': '1-2 weeks'
+    }),
+    MappingProxyType({
+        'name': 'Application and Experimentation',
+        'focus': 'Testing understanding through practical application',
+        'activities': (
+            'Design and implementation of practical experiments',
+            'Real-world application of insights',
+            'Collaboration on meaningful projects'
+        ),
+        'duration': '2-3 weeks'
+    }),
+    MappingProxyType({
+        'name': 'Reflection and Evolution',
+        'focus': 'Learning from experience and planning next steps',
+        'activities': (
+            'Comprehensive reflection on learning journey',
+            'Assessment of growth and change',
+            'Identification of new questions and directions'
+        ),
+        'duration': '1 week'
+    })
+)
+
+# Extra fields layered onto every base stage for each readiness level
+_READINESS_STAGE_ADJUSTMENTS = {
+    ReadinessLevel.BEGINNER: {'support_level': 'high', 'scaffolding': 'extensive'},
+    ReadinessLevel.INTERMEDIATE: {},
+    ReadinessLevel.ADVANCED: {'complexity': 'high', 'independence': 'maximum'}
+}
+
+_STAGE_VARIANTS = MappingProxyType({
+    level: tuple(MappingProxyType({**stage, **adjustments}) for stage in _BASE_STAGES)
+    for level, adjustments in _READINESS_STAGE_ADJUSTMENTS.items()
+})
+
+# Readiness lookup indexed by [experience][motivation]; unrecognised
+# experience reads as beginner and unrecognised motivation as medium
+_EXPERIENCE_INDEX = {'beginner': 0, 'intermediate': 1, 'advanced': 2}
+_MOTIVATION_INDEX = {'low': 0, 'medium': 1, 'high': 2}
+_READINESS_TABLE = (
+    (ReadinessLevel.BEGINNER, ReadinessLevel.BEGINNER, ReadinessLevel.INTERMEDIATE),
+    (ReadinessLevel.INTERMEDIATE, ReadinessLevel.INTERMEDIATE, ReadinessLevel.INTERMEDIATE),
+    (ReadinessLevel.BEGINNER, ReadinessLevel.BEGINNER, ReadinessLevel.ADVANCED)
+)
+
+# Pathway design templates
+_PATHWAY_TEMPLATES = MappingProxyType({
+    'stages': ('exploration', 'inquiry', 'synthesis', 'application', 'reflection'),
+    'activities': ('questioning', 'research', 'dialogue', 'experimentation', 'reflection'),
+    'assessments': ('portfolio', 'project', 'presentation', 'reflection', 'peer_feedback')
+})
+
+# Assessment strategy templates
+_ASSESSMENT_STRATEGIES = MappingProxyType({
+    'formative': ('ongoing questions', 'learning journal', 'peer dialogue', 'mentor check-ins'),
+    'summative': ('synthesis project', 'presentation', 'portfolio', 'reflection essay'),
+    'authentic': ('real-world application', 'community contribution', 'mentoring others')
+})
+
+# Assessment strategies for a learning pathway
+_ASSESSMENTS = (
+    MappingProxyType({
+        'name': 'Inquiry Portfolio',
+        'description': 'Collection of questions, explorations, and reflections',
+        'type': 'formative',
+        'frequency': 'ongoing'
+    }),
+    MappingProxyType({
+        'name': 'Perspective Analysis',
+        'description': 'Demonstration of multi-perspective understanding',
+        'type': 'formative',
+        'frequency': 'mid-pathway'
+    }),
+    MappingProxyType({
+        'name': 'Synthesis Project',
+        'description': 'Creative integration of learning into meaningful output',
+        'type': 'summative',
+        'frequency': 'end of pathway'
+    }),
+    MappingProxyType({
+        'name': 'Learning Reflection',
+        'description': 'Deep reflection on transformation and growth',
+        'type': 'reflective',
+        'frequency': 'end of pathway'
+    })
+)
+
+# Learning resource recommendations
+_RESOURCES = (
+    MappingProxyType({
+        'type': 'books',
+        'recommendations': 'Foundational texts and diverse perspectives on the topic',
+        'purpose': 'Building knowledge base and exposure to different viewpoints'
+    }),
+    MappingProxyType({
+        'type': 'experts',
+        'recommendations': 'Practitioners, researchers, and thought leaders in the field',
+        'purpose': 'Learning from experience and current thinking'
+    }),
+    MappingProxyType({
+        'type': 'communities',
+        'recommendations': 'Learning communities and discussion groups',
+        'purpose': 'Dialogue and collaborative exploration'
+    }),
+    MappingProxyType({
+        'type': 'experiences',
+        'recommendations': 'Direct experiences and immersive opportunities',
+        'purpose': 'Embodied learning and practical understanding'
+    })
+)
+
+# Reflection protocols for each pathway stage
+_REFLECTION_PROTOCOLS = (
+    MappingProxyType({
+        'stage': 'weekly',
+        'questions': _interned(
+            'What new questions emerged this week?',
+            'How has my understanding shifted?',
+            'What challenged my assumptions?',
+            'What do I want to explore next?'
+        )
+    }),
+    MappingProxyType({
+        'stage': 'milestone',
+        'questions': _interned(
+            'How has my relationship to this topic evolved?',
+            'What patterns am I beginning to see?',
+            'Where am I feeling stuck, and what might help?',
+            'How is this learning connecting to other areas of my life?'
+        )
+    }),
+    MappingProxyType({
+        'stage': 'completion',
+        'questions': _interned(
+            'What are the most significant insights from this learning journey?',
+            'How have I changed as a result of this exploration?',
+            'What questions will I continue to carry forward?',
+            'How will I apply what I\'ve learned?'
+        )
+    })
+)
+
+# Indicators of successful learning
+_SUCCESS_INDICATORS = _interned(
+    'Ability to ask increasingly sophisticated questions about the topic',
+    'Demonstration of multi-perspective understanding',
+    'Evidence of personal transformation or growth',
+    'Application of insights in real-world contexts',
+    'Continued curiosity and motivation for further learning',
+    'Contribution to others\' learning and understanding'
+)
+
+
+def _resolve_practical_templates(context: LearningContext) -> Tuple[str, ...]:
+    """Practical question templates for a context, defaulting to personal"""
+    match context:
+        case LearningContext.EDUCATIONAL:
+            return _EDUCATIONAL_PRACTICAL_TEMPLATES
+        case LearningContext.ORGANIZATIONAL:
+            return _ORGANIZATIONAL_PRACTICAL_TEMPLATES
+        case LearningContext.SOCIAL:
+            return _SOCIAL_PRACTICAL_TEMPLATES
+        case LearningContext.RESEARCH:
+            return _RESEARCH_PRACTICAL_TEMPLATES
+        case _:
+            return _PERSONAL_PRACTICAL_TEMPLATES
+
+
+def _resolve_stakeholders(context: LearningContext) -> Tuple[str, ...]:
+    """Stakeholder types for a context, defaulting to personal"""
+    return _STAKEHOLDER_SETS.get(context, _STAKEHOLDER_SETS[LearningContext.PERSONAL])
+
+
+def _plain_dicts(mappings: Sequence[Mapping[str, Any]]) -> Tuple[Dict[str, Any], ...]:
+    """Copy read-only template mappings into plain dicts the caller may modify or serialize"""
+    return tuple(dict(mapping) for mapping in mappings)
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value as a local ISO 8601 timestamp"""
+    import datetime
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+
+def _history_record(timestamp_ns: int, context: str, result: Any) -> Dict[str, Any]:
+    """Build a single timestamp/context/result history record"""
+    return {'timestamp': _format_timestamp(timestamp_ns), 'context': context, 'result': result._asdict()}
+
+
+class _HistoryRecords(Sequence[Dict[str, Any]]):
+    """
+    Read-only snapshot of a column-wise history.
+    Records are built only when accessed, so len() and indexing do not
+    format every stored entry.
+    """
+    
+    __slots__ = ('_timestamps_ns', '_contexts', '_results', '_length')
+    
+    def __init__(self, timestamps_ns: List[int], contexts: List[str], results: List[Any]):
+        self._timestamps_ns = timestamps_ns
+        self._contexts = contexts
+        self._results = results
+        # Histories only grow or are replaced, so fixing the length here
+        # keeps the snapshot stable while the owner keeps recording
+        self._length = len(results)
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("history index out of range")
+        return _history_record(self._timestamps_ns[index], self._contexts[index], self._results[index])
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, tuple, _HistoryRecords)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert framework objects that the stdlib json encoder cannot handle"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if is_dataclass(obj):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@functools.cache
+def _load_orjson():
+    """Import orjson on first use, or return None when it is not installed"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps_records(records: List[Dict[str, Any]]) -> str:
+    """Serialize history records to JSON, using orjson when it is installed"""
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.dumps(records, default=_json_default).decode("utf-8")
+    import json
+    return json.dumps(records, default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
+
+# Section separators for console output
+_SEP80 = "=" * 80
+_SEP60 = "=" * 60
+_SEP50 = "=" * 50
+_DASH60 = "-" * 60
+_DASH50 = "-" * 50
+_DASH40 = "-" * 40
+
 
+def _write_lines(lines: Sequence[str]):
+    """Write a block of lines to stdout with a single write"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
-class InquiryGenerator:
+
+class _HistoryColumns:
+    """
+    Records framework calls column-wise.
+    Timestamps, contexts and results are kept in parallel lists and only
+    turned into timestamp/context/result records when read or exported.
+    """
+    
+    __slots__ = ('_hist_timestamps_ns', '_hist_contexts', '_hist_results')
+    
+    @property
+    def history(self) -> Sequence[Dict[str, Any]]:
+        """
+        Read-only snapshot of the history.
+        Records are built on access; use clear_history() to reset it.
+        """
+        return _HistoryRecords(self._hist_timestamps_ns, self._hist_contexts, self._hist_results)
+    
+    def clear_history(self):
+        """Discard all recorded history"""
+        # New lists leave previously returned snapshots intact
+        self._hist_timestamps_ns = []
+        self._hist_contexts = []
+        self._hist_results = []
+    
+    def _record_history(self, context: LearningContext, result: Any):
+        """Append one call to the history columns"""
+        self._hist_timestamps_ns.append(time.time_ns())
+        self._hist_contexts.append(context.value)
+        self._hist_results.append(result)
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize the history as timestamp/context/result records"""
+        return [
+            _history_record(timestamp_ns, context, result)
+            for timestamp_ns, context, result in zip(self._hist_timestamps_ns, self._hist_contexts, self._hist_results)
+        ]
+    
+    def export_history(self) -> str:
+        """Export the history as a JSON string"""
+        return _dumps_records(self.to_records())
+
+
+class InquiryGenerator(_HistoryColumns):
     """
     Core framework for generating transformative inquiry sequences.
     Creates structured question progressions for deep learning and transformation.
     """
     
+    __slots__ = ('learning_patterns', '_sequence_cache')
+    
+    # Question templates for different contexts
+    question_templates: ClassVar[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+        'essential': (
+            "What is the fundamental nature of {}?",
+            "Why does {} matter?",
+            "How does {} connect to larger patterns?",
+            "What would change if {} were different?",
+            "What questions does {} raise?"
+        ),
+        'dialectical': (
+            "How does {} serve {} interests?",
+            "What tensions exist within {}?",
+            "Who benefits and who is marginalized by {}?",
+            "What would the opposite of {} look like?"
+        ),
+        'practical': (
+            "How can we apply {} in real situations?",
+            "What would it mean to live according to {}?",
+            "How can we measure progress with {}?",
+            "What obstacles prevent {} from being realized?"
+        )
+    })
+    
+    # Depth progression questions with a {topic} placeholder
+    _depth_templates: ClassVar[Mapping[str, Tuple[Question, ...]]] = MappingProxyType({
+        # Surface level questions
+        "surface": (
+            Question(
+                text="What do I already know about {topic}?",
+                question_type=QuestionType.ESSENTIAL,
+                depth_level=InquiryDepth.SURFACE,
+                context="",
+                follow_ups=("Where did this knowledge come from?",),
+                reasoning="Surface level exploration"
+            ),
+        ),
+        # Analytical level questions
+        "analytical": (
+            Question(
+                text="How do different experts or authorities view {topic}?",
+                question_type=QuestionType.PERSPECTIVE,
+                depth_level=InquiryDepth.ANALYTICAL,
+                context="",
+                follow_ups=("What are the underlying assumptions in each view?",),
+                reasoning="Analytical comparison of perspectives"
+            ),
+        ),
+        # Transformative level questions
+        "transformative": (
+            Question(
+                text="How does deep understanding of {topic} change how I see the world?",
+                question_type=QuestionType.SYNTHETIC,
+                depth_level=InquiryDepth.TRANSFORMATIVE,
+                context="",
+                follow_ups=("What beliefs or assumptions am I now questioning?",),
+                reasoning="Transformative reflection on worldview changes"
+            ),
+        ),
+        # Emergent level questions
+        "emergent": (
+            Question(
+                text="What new questions about {topic} are emerging that nobody has asked before?",
+                question_type=QuestionType.EMERGENT,
+                depth_level=InquiryDepth.EMERGENT,
+                context="",
+                follow_ups=("How might these questions reshape our understanding?",),
+                reasoning="Emergent inquiry generation"
+            ),
+        )
+    })
+    
+    # Maximum number of inquiry sequences kept per generator
+    _sequence_cache_size: ClassVar[int] = 256
+    
     def __init__(self):
-        self.question_templates = self._initialize_question_templates()
-        self.inquiry_history = []
         self.learning_patterns = {}
+        self._sequence_cache = {}
+        self.clear_history()
+    
+    # Inquiry history snapshot; see _HistoryColumns
+    inquiry_history = _HistoryColumns.history
     
     def generate_inquiry_sequence(self, topic: str, context: LearningContext = LearningContext.PERSONAL, 
-                                depth: int = 3) -> InquirySequenceResult:
+                                depth: int = 3, verbose: bool = True) -> InquirySequenceResult:
         """
         Generate a comprehensive inquiry sequence for transformative learning.
         
@@ -107,152 +809,93 @@ class InquiryGenerator:
             topic: The subject matter for inquiry
             context: Learning context (personal, educational, organizational, etc.)
             depth: Complexity and depth level (1-5)
+            verbose: Print the generated questions and results to stdout
             
         Returns:
             InquirySequenceResult containing structured question progression
         """
-        print(f"❓ INQUIRY METHODOLOGY FRAMEWORK - QUESTION GENERATION")
-        print(f"Topic: {topic}")
-        print(f"Context: {context.value.upper()}")
-        print(f"Depth Level: {depth}/5")
-        print("=" * 80)
-        
-        # Generate essential questions
-        essential_questions = self._generate_essential_questions(topic, context, depth)
-        
-        # Create dialectical question pairs
-        dialectical_pairs = self._generate_dialectical_pairs(topic, context, depth)
-        
-        # Generate synthesis questions
-        synthesis_questions = self._generate_synthesis_questions(topic, essential_questions, dialectical_pairs)
-        
-        # Create practical application questions
-        practical_applications = self._generate_practical_questions(topic, context, depth)
-        
-        # Design learning pathway
-        learning_pathway = self._design_learning_pathway(essential_questions, dialectical_pairs, synthesis_questions)
-        
-        # Create depth progression
-        depth_progression = self._create_depth_progression(topic, context, depth)
-        
-        result = InquirySequenceResult(
-            topic=topic,
-            essential_questions=essential_questions,
-            dialectical_pairs=dialectical_pairs,
-            synthesis_questions=synthesis_questions,
-            practical_applications=practical_applications,
-            learning_pathway=learning_pathway,
-            depth_progression=depth_progression
-        )
+        # Sequences are deterministic for a given topic, context and depth,
+        # so repeated requests share the cached, read-only result
+        key = (topic, context, depth)
+        result = self._sequence_cache.pop(key, None)
+        if result is None:
+            result = self._build_inquiry_sequence(topic, context, depth)
+            if len(self._sequence_cache) >= self._sequence_cache_size:
+                # Evict the least recently used entry, which is always first
+                # because hits are moved back to the end below
+                del self._sequence_cache[next(iter(self._sequence_cache))]
+        self._sequence_cache[key] = result
         
         # Store in inquiry history
-        self.inquiry_history.append({
-            'timestamp': datetime.datetime.now().isoformat(),
-            'context': context.value,
-            'result': result._asdict()
-        })
+        self._record_history(context, result)
         
-        self._display_inquiry_results(result)
+        if verbose:
+            # Output is collected per call and written once
+            lines = [
+                f"❓ INQUIRY METHODOLOGY FRAMEWORK - QUESTION GENERATION",
+                f"Topic: {topic}",
+                f"Context: {context.upper()}",
+                f"Depth Level: {depth}/5",
+                _SEP80
+            ]
+            self._display_question_sections(result, lines)
+            self._display_inquiry_results(result, lines)
+            _write_lines(lines)
         return result
     
+    def _build_inquiry_sequence(self, topic: str, context: LearningContext, depth: int) -> InquirySequenceResult:
+        """Create the lazily evaluated inquiry sequence without any output or history side effects"""
+        return InquirySequenceResult(self, topic, context, depth)
+    
     def _generate_essential_questions(self, topic: str, context: LearningContext, depth: int) -> List[Question]:
         """Generate essential questions that go to the heart of the topic"""
-        print(f"\n🎯 ESSENTIAL QUESTIONS GENERATION")
-        print("-" * 50)
-        
-        essential_templates = [
-            f"What is the fundamental nature of {topic}?",
-            f"Why does {topic} matter in our current context?",
-            f"How does {topic} challenge our existing assumptions?",
-            f"What would change if we fully understood {topic}?",
-            f"What questions does {topic} raise that we haven't considered?"
-        ]
-        
         questions = []
-        for i, template in enumerate(essential_templates[:depth], 1):
-            question = Question(
-                text=template,
-                question_type=QuestionType.ESSENTIAL,
-                depth_level=InquiryDepth.ANALYTICAL,
+        for i, template in enumerate(_ESSENTIAL_TEMPLATES[:depth], 1):
+            question = _ESSENTIAL_PROTOTYPE(
+                text=template.format(topic=topic),
                 context=context.value,
-                follow_ups=[
-                    f"How does this connect to your personal experience?",
-                    f"What evidence supports or challenges this perspective?",
-                    f"What would someone from a different background think?"
-                ],
                 reasoning=f"Essential question {i} designed to explore fundamental aspects of {topic}"
             )
             questions.append(question)
-            print(f"   {i}. {question.text}")
-            print(f"      Type: {question.question_type.value} | Depth: {question.depth_level.value}")
         
         return questions
     
     def _generate_dialectical_pairs(self, topic: str, context: LearningContext, depth: int) -> List[Tuple[Question, Question]]:
         """Generate dialectical question pairs that explore contradictions"""
-        print(f"\n🔄 DIALECTICAL QUESTION PAIRS")
-        print("-" * 50)
-        
-        dialectical_themes = [
-            ("individual", "collective"),
-            ("tradition", "innovation"),
-            ("efficiency", "equity"),
-            ("freedom", "responsibility"),
-            ("local", "global")
-        ]
-        
         pairs = []
-        for i, (thesis_theme, antithesis_theme) in enumerate(dialectical_themes[:depth], 1):
-            thesis = Question(
+        for i, (thesis_theme, antithesis_theme) in enumerate(_DIALECTICAL_THEMES[:depth], 1):
+            thesis = _DIALECTICAL_PROTOTYPE(
                 text=f"How does {topic} serve {thesis_theme} interests and values?",
-                question_type=QuestionType.DIALECTICAL,
-                depth_level=InquiryDepth.ANALYTICAL,
                 context=context.value,
-                follow_ups=[
-                    f"What evidence supports this {thesis_theme} perspective?",
-                    f"Who benefits most from this {thesis_theme} approach?",
-                    f"What are the limitations of focusing solely on {thesis_theme} aspects?"
-                ],
+                follow_ups=_DIALECTICAL_FOLLOW_UPS[thesis_theme],
                 reasoning=f"Dialectical thesis exploring {thesis_theme} dimension of {topic}"
             )
             
-            antithesis = Question(
+            antithesis = _DIALECTICAL_PROTOTYPE(
                 text=f"How does {topic} serve {antithesis_theme} interests and values?",
-                question_type=QuestionType.DIALECTICAL,
-                depth_level=InquiryDepth.ANALYTICAL,
                 context=context.value,
-                follow_ups=[
-                    f"What evidence supports this {antithesis_theme} perspective?",
-                    f"Who benefits most from this {antithesis_theme} approach?",
-                    f"What are the limitations of focusing solely on {antithesis_theme} aspects?"
-                ],
+                follow_ups=_DIALECTICAL_FOLLOW_UPS[antithesis_theme],
                 reasoning=f"Dialectical antithesis exploring {antithesis_theme} dimension of {topic}"
             )
             
             pairs.append((thesis, antithesis))
-            print(f"   Pair {i}:")
-            print(f"      Thesis: {thesis.text}")
-            print(f"      Antithesis: {antithesis.text}")
         
         return pairs
     
     def _generate_synthesis_questions(self, topic: str, essential_questions: List[Question], 
                                     dialectical_pairs: List[Tuple[Question, Question]]) -> List[Question]:
         """Generate synthesis questions that integrate multiple perspectives"""
-        print(f"\n⚡ SYNTHESIS QUESTIONS")
-        print("-" * 50)
-        
         synthesis_questions = [
             Question(
                 text=f"How can we integrate multiple perspectives on {topic} into a coherent understanding?",
                 question_type=QuestionType.SYNTHETIC,
                 depth_level=InquiryDepth.TRANSFORMATIVE,
                 context="synthesis",
-                follow_ups=[
+                follow_ups=(
                     "What common ground exists across different viewpoints?",
                     "Where are the irreconcilable differences, and how do we navigate them?",
                     "What new possibilities emerge from this integration?"
-                ],
+                ),
                 reasoning="Synthesis question for integrating multiple perspectives"
             ),
             Question(
@@ -260,11 +903,11 @@ class InquiryGenerator:
                 question_type=QuestionType.EMERGENT,
                 depth_level=InquiryDepth.EMERGENT,
                 context="innovation",
-                follow_ups=[
+                follow_ups=(
                     "What assumptions would we need to let go of?",
                     "What would success look like in this new approach?",
                     "How would we know if we're moving in the right direction?"
-                ],
+                ),
                 reasoning="Emergent question for innovative thinking"
             ),
             Question(
@@ -272,203 +915,104 @@ class InquiryGenerator:
                 question_type=QuestionType.PRACTICAL,
                 depth_level=InquiryDepth.TRANSFORMATIVE,
                 context="action",
-                follow_ups=[
+                follow_ups=(
                     "What are the ethical implications of what we've learned?",
                     "What would we do differently based on this understanding?",
                     "How do we maintain accountability to these insights?"
-                ],
+                ),
                 reasoning="Action-oriented synthesis question"
             )
         ]
         
-        for i, question in enumerate(synthesis_questions, 1):
-            print(f"   {i}. {question.text}")
-            print(f"      Type: {question.question_type.value} | Depth: {question.depth_level.value}")
-        
         return synthesis_questions
     
     def _generate_practical_questions(self, topic: str, context: LearningContext, depth: int) -> List[Question]:
         """Generate practical application questions"""
-        print(f"\n🔧 PRACTICAL APPLICATION QUESTIONS")
-        print("-" * 50)
-        
-        practical_templates = {
-            LearningContext.PERSONAL: [
-                f"How can I apply insights about {topic} in my daily life?",
-                f"What changes would I need to make to align with my understanding of {topic}?",
-                f"How can I continue learning about {topic} in meaningful ways?"
-            ],
-            LearningContext.EDUCATIONAL: [
-                f"How can we design learning experiences that help others understand {topic}?",
-                f"What assessment methods would capture deep understanding of {topic}?",
-                f"How can we make {topic} relevant and engaging for diverse learners?"
-            ],
-            LearningContext.ORGANIZATIONAL: [
-                f"How can our organization implement insights about {topic}?",
-                f"What systems and structures need to change to support {topic}?",
-                f"How can we measure progress and impact related to {topic}?"
-            ],
-            LearningContext.SOCIAL: [
-                f"How can communities work together to address {topic}?",
-                f"What policies and practices would support positive change around {topic}?",
-                f"How can we engage diverse stakeholders in conversations about {topic}?"
-            ],
-            LearningContext.RESEARCH: [
-                f"What research questions about {topic} remain unexplored?",
-                f"How can we study {topic} in ways that honor its complexity?",
-                f"What methodologies would best capture the nuances of {topic}?"
-            ]
-        }
-        
-        templates = practical_templates.get(context, practical_templates[LearningContext.PERSONAL])
+        templates = _resolve_practical_templates(context)
         questions = []
         
         for i, template in enumerate(templates[:depth], 1):
-            question = Question(
-                text=template,
-                question_type=QuestionType.PRACTICAL,
-                depth_level=InquiryDepth.ANALYTICAL,
+            question = _PRACTICAL_PROTOTYPE(
+                text=template.format(topic=topic),
                 context=context.value,
-                follow_ups=[
-                    "What would be the first step?",
-                    "What resources and support would be needed?",
-                    "How would we know if we're making progress?"
-                ],
-                reasoning=f"Practical application question for {context.value} context"
+                reasoning=sys.intern(f"Practical application question for {context.value} context")
             )
             questions.append(question)
-            print(f"   {i}. {question.text}")
         
         return questions
     
     def _design_learning_pathway(self, essential_questions: List[Question], 
                                dialectical_pairs: List[Tuple[Question, Question]], 
-                               synthesis_questions: List[Question]) -> List[str]:
+                               synthesis_questions: List[Question]) -> Sequence[str]:
         """Design a progressive learning pathway"""
-        pathway = [
-            "Begin with personal reflection on essential questions",
-            "Explore multiple perspectives through dialectical inquiry",
-            "Engage in dialogue with others holding different viewpoints",
-            "Seek synthesis and integration of diverse perspectives",
-            "Apply insights through practical experimentation",
-            "Reflect on learning and identify next questions",
-            "Share insights with learning community",
-            "Iterate and deepen understanding"
-        ]
-        return pathway
+        return _LEARNING_PATHWAY_STEPS
     
     def _create_depth_progression(self, topic: str, context: LearningContext, depth: int) -> Dict[str, List[Question]]:
         """Create questions organized by depth level"""
-        progression = {
-            "surface": [],
-            "analytical": [],
-            "transformative": [],
-            "emergent": []
+        return {
+            level: [replace(question, text=question.text.format(topic=topic), context=context.value)
+                    for question in questions]
+            for level, questions in self._depth_templates.items()
         }
+    
+    def _display_question_sections(self, result: InquirySequenceResult, lines: List[str]):
+        """Display the generated questions section by section"""
+        lines += [f"\n🎯 ESSENTIAL QUESTIONS GENERATION", _DASH50]
+        for i, question in enumerate(result.essential_questions, 1):
+            lines.append(f"   {i}. {question.text}")
+            lines.append(f"      Type: {question.question_type.value} | Depth: {question.depth_level.value}")
         
-        # Surface level questions
-        progression["surface"] = [
-            Question(
-                text=f"What do I already know about {topic}?",
-                question_type=QuestionType.ESSENTIAL,
-                depth_level=InquiryDepth.SURFACE,
-                context=context.value,
-                follow_ups=["Where did this knowledge come from?"],
-                reasoning="Surface level exploration"
-            )
-        ]
+        lines += [f"\n🔄 DIALECTICAL QUESTION PAIRS", _DASH50]
+        for i, (thesis, antithesis) in enumerate(result.dialectical_pairs, 1):
+            lines.append(f"   Pair {i}:")
+            lines.append(f"      Thesis: {thesis.text}")
+            lines.append(f"      Antithesis: {antithesis.text}")
         
-        # Analytical level questions
-        progression["analytical"] = [
-            Question(
-                text=f"How do different experts or authorities view {topic}?",
-                question_type=QuestionType.PERSPECTIVE,
-                depth_level=InquiryDepth.ANALYTICAL,
-                context=context.value,
-                follow_ups=["What are the underlying assumptions in each view?"],
-                reasoning="Analytical comparison of perspectives"
-            )
-        ]
+        lines += [f"\n⚡ SYNTHESIS QUESTIONS", _DASH50]
+        for i, question in enumerate(result.synthesis_questions, 1):
+            lines.append(f"   {i}. {question.text}")
+            lines.append(f"      Type: {question.question_type.value} | Depth: {question.depth_level.value}")
         
-        # Transformative level questions
-        progression["transformative"] = [
-            Question(
-                text=f"How does deep understanding of {topic} change how I see the world?",
-                question_type=QuestionType.SYNTHETIC,
-                depth_level=InquiryDepth.TRANSFORMATIVE,
-                context=context.value,
-                follow_ups=["What beliefs or assumptions am I now questioning?"],
-                reasoning="Transformative reflection on worldview changes"
-            )
-        ]
-        
-        # Emergent level questions
-        progression["emergent"] = [
-            Question(
-                text=f"What new questions about {topic} are emerging that nobody has asked before?",
-                question_type=QuestionType.EMERGENT,
-                depth_level=InquiryDepth.EMERGENT,
-                context=context.value,
-                follow_ups=["How might these questions reshape our understanding?"],
-                reasoning="Emergent inquiry generation"
-            )
-        ]
-        
-        return progression
+        lines += [f"\n🔧 PRACTICAL APPLICATION QUESTIONS", _DASH50]
+        for i, question in enumerate(result.practical_applications, 1):
+            lines.append(f"   {i}. {question.text}")
     
-    def _display_inquiry_results(self, result: InquirySequenceResult):
+    def _display_inquiry_results(self, result: InquirySequenceResult, lines: List[str]):
         """Display formatted results of inquiry generation"""
-        print(f"\n📋 INQUIRY SEQUENCE RESULTS")
-        print("=" * 60)
-        print(f"🎯 Topic: {result.topic}")
-        
-        print(f"\n📊 QUESTION DISTRIBUTION:")
-        print(f"   Essential Questions: {len(result.essential_questions)}")
-        print(f"   Dialectical Pairs: {len(result.dialectical_pairs)}")
-        print(f"   Synthesis Questions: {len(result.synthesis_questions)}")
-        print(f"   Practical Applications: {len(result.practical_applications)}")
-        
-        print(f"\n🛤️ LEARNING PATHWAY:")
-        for i, step in enumerate(result.learning_pathway[:5], 1):
-            print(f"   {i}. {step}")
-    
-    def _initialize_question_templates(self) -> Dict[str, List[str]]:
-        """Initialize question templates for different contexts"""
-        return {
-            'essential': [
-                "What is the fundamental nature of {}?",
-                "Why does {} matter?",
-                "How does {} connect to larger patterns?",
-                "What would change if {} were different?",
-                "What questions does {} raise?"
-            ],
-            'dialectical': [
-                "How does {} serve {} interests?",
-                "What tensions exist within {}?",
-                "Who benefits and who is marginalized by {}?",
-                "What would the opposite of {} look like?"
-            ],
-            'practical': [
-                "How can we apply {} in real situations?",
-                "What would it mean to live according to {}?",
-                "How can we measure progress with {}?",
-                "What obstacles prevent {} from being realized?"
-            ]
-        }
+        lines += [
+            f"\n📋 INQUIRY SEQUENCE RESULTS",
+            _SEP60,
+            f"🎯 Topic: {result.topic}",
+            f"\n📊 QUESTION DISTRIBUTION:",
+            f"   Essential Questions: {len(result.essential_questions)}",
+            f"   Dialectical Pairs: {len(result.dialectical_pairs)}",
+            f"   Synthesis Questions: {len(result.synthesis_questions)}",
+            f"   Practical Applications: {len(result.practical_applications)}",
+            f"\n🛤️ LEARNING PATHWAY:"
+        ]
+        lines.extend(f"   {i}. {step}" for i, step in enumerate(result.learning_pathway[:5], 1))
 
 
-class PerspectiveRotator:
+class PerspectiveRotator(_HistoryColumns):
     """
     Framework for systematic perspective exploration and stakeholder analysis.
     Enables multi-dimensional understanding through viewpoint cycling.
     """
     
+    __slots__ = ()
+    
+    # Stakeholder templates for different contexts
+    stakeholder_templates: ClassVar[Mapping[str, Tuple[str, ...]]] = _STAKEHOLDER_TEMPLATES
+    
     def __init__(self):
-        self.stakeholder_templates = self._initialize_stakeholder_templates()
-        self.rotation_history = []
+        self.clear_history()
+    
+    # Rotation history snapshot; see _HistoryColumns
+    rotation_history = _HistoryColumns.history
     
     def rotate_perspectives(self, topic: str, stakeholders: int = 5, 
-                          context: LearningContext = LearningContext.PERSONAL) -> PerspectiveRotationResult:
+                          context: LearningContext = LearningContext.PERSONAL,
+                          verbose: bool = True) -> PerspectiveRotationResult:
         """
         Systematically explore multiple perspectives on a topic.
         
@@ -476,16 +1020,11 @@ class PerspectiveRotator:
             topic: The subject matter for perspective analysis
             stakeholders: Number of different perspectives to explore
             context: Learning context for perspective selection
+            verbose: Print the perspectives and results to stdout
             
         Returns:
             PerspectiveRotationResult containing multi-perspective analysis
         """
-        print(f"🔄 PERSPECTIVE ROTATION ANALYSIS")
-        print(f"Topic: {topic}")
-        print(f"Stakeholders: {stakeholders}")
-        print(f"Context: {context.value.upper()}")
-        print("=" * 60)
-        
         # Generate diverse perspectives
         perspectives = self._generate_stakeholder_perspectives(topic, stakeholders, context)
         
@@ -511,88 +1050,49 @@ class PerspectiveRotator:
         )
         
         # Store in rotation history
-        self.rotation_history.append({
-            'timestamp': datetime.datetime.now().isoformat(),
-            'context': context.value,
-            'result': result._asdict()
-        })
+        self._record_history(context, result)
         
-        self._display_perspective_results(result)
+        if verbose:
+            # Output is collected per call and written once
+            lines = [
+                f"🔄 PERSPECTIVE ROTATION ANALYSIS",
+                f"Topic: {topic}",
+                f"Stakeholders: {stakeholders}",
+                f"Context: {context.upper()}",
+                _SEP60
+            ]
+            self._display_stakeholder_perspectives(perspectives, lines)
+            self._display_perspective_results(result, lines)
+            _write_lines(lines)
         return result
     
     def _generate_stakeholder_perspectives(self, topic: str, count: int, context: LearningContext) -> List[Perspective]:
         """Generate diverse stakeholder perspectives"""
-        print(f"\n👥 STAKEHOLDER PERSPECTIVES")
-        print("-" * 40)
-        
-        # Context-specific stakeholder types
-        stakeholder_sets = {
-            LearningContext.EDUCATIONAL: [
-                "students", "teachers", "administrators", "parents", "community members", 
-                "policymakers", "researchers", "industry partners"
-            ],
-            LearningContext.ORGANIZATIONAL: [
-                "employees", "managers", "customers", "shareholders", "competitors",
-                "regulators", "communities", "suppliers"
-            ],
-            LearningContext.SOCIAL: [
-                "citizens", "government", "activists", "businesses", "media",
-                "researchers", "international observers", "future generations"
-            ],
-            LearningContext.PERSONAL: [
-                "current self", "future self", "family", "friends", "mentors",
-                "critics", "strangers", "cultural background"
-            ],
-            LearningContext.RESEARCH: [
-                "researchers", "participants", "funders", "peer reviewers", "practitioners",
-                "policymakers", "affected communities", "skeptics"
-            ]
-        }
+        selected_stakeholders = _resolve_stakeholders(context)[:count]
         
-        stakeholder_list = stakeholder_sets.get(context, stakeholder_sets[LearningContext.PERSONAL])
-        selected_stakeholders = stakeholder_list[:count]
+        # Concerns and opportunities depend only on the topic, so they are
+        # built once per call and shared by every perspective
+        values = {'topic': topic}
+        concerns = tuple(template.format_map(values) for template in _PERSPECTIVE_TEMPLATES['concerns'])
+        opportunities = tuple(template.format_map(values) for template in _PERSPECTIVE_TEMPLATES['opportunities'])
         
         perspectives = []
-        for i, stakeholder in enumerate(selected_stakeholders, 1):
+        for stakeholder in selected_stakeholders:
+            values['stakeholder'] = stakeholder
             perspective = Perspective(
                 stakeholder=stakeholder,
-                viewpoint=f"From a {stakeholder} perspective, {topic} represents both opportunities and challenges for our interests and values.",
-                concerns=[
-                    f"How will {topic} affect our core interests?",
-                    f"What risks does {topic} pose to our wellbeing?",
-                    f"How can we have a voice in decisions about {topic}?"
-                ],
-                opportunities=[
-                    f"How can {topic} advance our goals?",
-                    f"What new possibilities does {topic} create?",
-                    f"How can we contribute positively to {topic}?"
-                ],
-                questions=[
-                    f"What would {stakeholder} most want to know about {topic}?",
-                    f"What would {stakeholder} most fear about {topic}?",
-                    f"What would {stakeholder} most hope for regarding {topic}?"
-                ]
+                viewpoint=_PERSPECTIVE_TEMPLATES['viewpoint'].format_map(values),
+                concerns=concerns,
+                opportunities=opportunities,
+                questions=tuple(template.format_map(values) for template in _PERSPECTIVE_TEMPLATES['questions'])
             )
             perspectives.append(perspective)
-            
-            print(f"   {i}. {stakeholder.title()} Perspective:")
-            print(f"      Viewpoint: {perspective.viewpoint}")
-            print(f"      Key Concern: {perspective.concerns[0]}")
-            print(f"      Key Opportunity: {perspective.opportunities[0]}")
-            print()
         
         return perspectives
     
     def _generate_synthesis_insights(self, perspectives: List[Perspective], topic: str) -> List[str]:
         """Generate insights from perspective synthesis"""
-        insights = [
-            f"Multiple stakeholders share common concerns about transparency and fairness in {topic}",
-            f"Different perspectives reveal complementary rather than competing interests in {topic}",
-            f"Successful implementation of {topic} requires addressing diverse stakeholder needs simultaneously",
-            f"The complexity of {topic} becomes clearer when viewed through multiple lenses",
-            f"Creative solutions emerge when we consider how {topic} can serve multiple stakeholder groups"
-        ]
-        return insights
+        return [template.format(topic=topic) for template in _SYNTHESIS_INSIGHT_TEMPLATES]
     
     def _generate_bridging_questions(self, perspectives: List[Perspective], topic: str) -> List[Question]:
         """Generate questions that bridge different perspectives"""
@@ -602,11 +1102,11 @@ class PerspectiveRotator:
                 question_type=QuestionType.SYNTHETIC,
                 depth_level=InquiryDepth.TRANSFORMATIVE,
                 context="bridging",
-                follow_ups=[
+                follow_ups=(
                     "Where do stakeholder interests naturally align?",
                     "What would win-win solutions look like?",
                     "How can we build on common ground?"
-                ],
+                ),
                 reasoning="Question designed to find shared values across perspectives"
             ),
             Question(
@@ -614,73 +1114,52 @@ class PerspectiveRotator:
                 question_type=QuestionType.PRACTICAL,
                 depth_level=InquiryDepth.ANALYTICAL,
                 context="problem-solving",
-                follow_ups=[
+                follow_ups=(
                     "What would each group need to feel heard and respected?",
                     "Where are the non-negotiable boundaries for each group?",
                     "What creative compromises might be possible?"
-                ],
+                ),
                 reasoning="Question focused on inclusive problem-solving"
             )
         ]
         return bridging_questions
     
-    def _identify_collaboration_opportunities(self, perspectives: List[Perspective]) -> List[str]:
+    def _identify_collaboration_opportunities(self, perspectives: List[Perspective]) -> Sequence[str]:
         """Identify potential collaboration opportunities"""
-        opportunities = [
-            "Shared learning initiatives where stakeholders educate each other",
-            "Joint problem-solving sessions focused on common challenges",
-            "Collaborative pilot projects that test solutions together",
-            "Cross-stakeholder advisory groups for ongoing dialogue",
-            "Resource sharing arrangements that benefit multiple groups"
-        ]
-        return opportunities
+        return _COLLABORATION_OPPORTUNITIES
     
-    def _identify_potential_conflicts(self, perspectives: List[Perspective]) -> List[str]:
+    def _identify_potential_conflicts(self, perspectives: List[Perspective]) -> Sequence[str]:
         """Identify potential areas of conflict"""
-        conflicts = [
-            "Resource allocation priorities may differ significantly between groups",
-            "Timeline preferences may conflict between stakeholders with different urgencies",
-            "Risk tolerance levels vary substantially across stakeholder groups",
-            "Cultural values and approaches to change may clash",
-            "Information sharing preferences may create transparency tensions"
-        ]
-        return conflicts
+        return _POTENTIAL_CONFLICTS
     
-    def _display_perspective_results(self, result: PerspectiveRotationResult):
+    def _display_stakeholder_perspectives(self, perspectives: List[Perspective], lines: List[str]):
+        """Display each stakeholder perspective with its key concern and opportunity"""
+        lines += [f"\n👥 STAKEHOLDER PERSPECTIVES", _DASH40]
+        for i, perspective in enumerate(perspectives, 1):
+            lines += [
+                f"   {i}. {perspective.stakeholder.title()} Perspective:",
+                f"      Viewpoint: {perspective.viewpoint}",
+                f"      Key Concern: {perspective.concerns[0]}",
+                f"      Key Opportunity: {perspective.opportunities[0]}",
+                ""
+            ]
+    
+    def _display_perspective_results(self, result: PerspectiveRotationResult, lines: List[str]):
         """Display formatted results of perspective rotation"""
-        print(f"\n📊 PERSPECTIVE ROTATION RESULTS")
-        print("=" * 50)
-        print(f"🎯 Topic: {result.topic}")
-        print(f"👥 Perspectives Explored: {len(result.perspectives)}")
-        
-        print(f"\n💡 SYNTHESIS INSIGHTS:")
-        for i, insight in enumerate(result.synthesis_insights[:3], 1):
-            print(f"   {i}. {insight}")
+        lines += [
+            f"\n📊 PERSPECTIVE ROTATION RESULTS",
+            _SEP50,
+            f"🎯 Topic: {result.topic}",
+            f"👥 Perspectives Explored: {len(result.perspectives)}",
+            f"\n💡 SYNTHESIS INSIGHTS:"
+        ]
+        lines.extend(f"   {i}. {insight}" for i, insight in enumerate(result.synthesis_insights[:3], 1))
         
-        print(f"\n🤝 COLLABORATION OPPORTUNITIES:")
-        for i, opportunity in enumerate(result.collaborative_opportunities[:3], 1):
-            print(f"   {i}. {opportunity}")
+        lines.append(f"\n🤝 COLLABORATION OPPORTUNITIES:")
+        lines.extend(f"   {i}. {opportunity}" for i, opportunity in enumerate(result.collaborative_opportunities[:3], 1))
         
-        print(f"\n⚠️ POTENTIAL CONFLICTS:")
-        for i, conflict in enumerate(result.potential_conflicts[:3], 1):
-            print(f"   {i}. {conflict}")
-    
-    def _initialize_stakeholder_templates(self) -> Dict[str, List[str]]:
-        """Initialize stakeholder templates for different contexts"""
-        return {
-            'universal': [
-                "current self", "future self", "family", "community", "society",
-                "environment", "future generations", "global perspective"
-            ],
-            'organizational': [
-                "employees", "customers", "shareholders", "management", "competitors",
-                "suppliers", "regulators", "community"
-            ],
-            'educational': [
-                "students", "teachers", "parents", "administrators", "community",
-                "employers", "policymakers", "researchers"
-            ]
-        }
+        lines.append(f"\n⚠️ POTENTIAL CONFLICTS:")
+        lines.extend(f"   {i}. {conflict}" for i, conflict in enumerate(result.potential_conflicts[:3], 1))
 
 
 class LearningPathwayDesigner:
@@ -689,12 +1168,15 @@ class LearningPathwayDesigner:
     Creates adaptive sequences that respond to learner progress and interests.
     """
     
-    def __init__(self):
-        self.pathway_templates = self._initialize_pathway_templates()
-        self.assessment_strategies = self._initialize_assessment_strategies()
+    __slots__ = ()
+    
+    # Pathway design and assessment strategy templates
+    pathway_templates: ClassVar[Mapping[str, Tuple[str, ...]]] = _PATHWAY_TEMPLATES
+    assessment_strategies: ClassVar[Mapping[str, Tuple[str, ...]]] = _ASSESSMENT_STRATEGIES
     
     def design_learning_pathway(self, topic: str, learner_profile: Dict[str, Any], 
-                              context: LearningContext = LearningContext.PERSONAL) -> Dict[str, Any]:
+                              context: LearningContext = LearningContext.PERSONAL,
+                              verbose: bool = True) -> Dict[str, Any]:
         """
         Design a personalized inquiry-based learning pathway.
         
@@ -702,15 +1184,28 @@ class LearningPathwayDesigner:
             topic: Subject matter for the learning pathway
             learner_profile: Information about the learner's background, interests, and goals
             context: Learning context and environment
+            verbose: Print the pathway design to stdout
             
         Returns:
             Comprehensive learning pathway with stages, activities, and assessments
         """
-        print(f"🛤️ LEARNING PATHWAY DESIGN")
-        print(f"Topic: {topic}")
-        print(f"Learner Context: {context.value.upper()}")
-        print("=" * 60)
+        pathway = self._assemble_pathway(topic, learner_profile, context)
         
+        if verbose:
+            # Output is collected per call and written once
+            lines = [
+                f"🛤️ LEARNING PATHWAY DESIGN\n"
+                f"Topic: {topic}\n"
+                f"Learner Context: {context.upper()}\n"
+                f"{_SEP60}"
+            ]
+            self._display_pathway_design(pathway, lines)
+            _write_lines(lines)
+        return pathway
+    
+    def _assemble_pathway(self, topic: str, learner_profile: Dict[str, Any],
+                          context: LearningContext) -> Dict[str, Any]:
+        """Assemble the pathway stages, assessments, resources and reflections"""
         # Analyze learner readiness
         readiness_level = self._assess_learner_readiness(learner_profile, topic)
         
@@ -729,7 +1224,7 @@ class LearningPathwayDesigner:
         pathway = {
             'topic': topic,
             'learner_profile': learner_profile,
-            'readiness_level': readiness_level,
+            'readiness_level': readiness_level.name.lower(),
             'learning_stages': learning_stages,
             'assessments': assessments,
             'resources': resources,
@@ -737,230 +1232,62 @@ class LearningPathwayDesigner:
             'estimated_duration': f"{len(learning_stages) * 2} weeks",
             'success_indicators': self._define_success_indicators(topic, context)
         }
-        
-        self._display_pathway_design(pathway)
         return pathway
     
-    def _assess_learner_readiness(self, profile: Dict[str, Any], topic: str) -> str:
+    def _assess_learner_readiness(self, profile: Dict[str, Any], topic: str) -> ReadinessLevel:
         """Assess learner readiness level"""
         # Simplified readiness assessment
-        experience = profile.get('experience_level', 'beginner')
-        motivation = profile.get('motivation_level', 'medium')
-        time_commitment = profile.get('time_available', 'limited')
-        
-        if experience == 'advanced' and motivation == 'high':
-            return 'advanced'
-        elif experience == 'intermediate' or motivation == 'high':
-            return 'intermediate'
-        else:
-            return 'beginner'
-    
-    def _design_learning_stages(self, topic: str, readiness_level: str, context: LearningContext) -> List[Dict[str, Any]]:
-        """Design progressive learning stages"""
-        base_stages = [
-            {
-                'name': 'Exploration and Orientation',
-                'focus': 'Understanding the landscape and developing initial questions',
-                'activities': [
-                    'Personal reflection on existing knowledge and experiences',
-                    'Exploration of diverse perspectives and approaches',
-                    'Generation of initial questions and learning goals'
-                ],
-                'duration': '1-2 weeks'
-            },
-            {
-                'name': 'Deep Inquiry and Analysis',
-                'focus': 'Systematic investigation through structured questioning',
-                'activities': [
-                    'Dialectical exploration of different viewpoints',
-                    'Research and evidence gathering',
-                    'Dialogue with experts and peers'
-                ],
-                'duration': '2-3 weeks'
-            },
-            {
-                'name': 'Synthesis and Integration',
-                'focus': 'Connecting insights and developing understanding',
-                'activities': [
-                    'Pattern recognition and connection making',
-                    'Integration of multiple perspectives',
-                    'Development of personal frameworks and models'
-                ],
-                'duration': '1-2 weeks'
-            },
-            {
-                'name': 'Application and Experimentation',
-                'focus': 'Testing understanding through practical application',
-                'activities': [
-                    'Design and implementation of practical experiments',
-                    'Real-world application of insights',
-                    'Collaboration on meaningful projects'
-                ],
-                'duration': '2-3 weeks'
-            },
-            {
-                'name': 'Reflection and Evolution',
-                'focus': 'Learning from experience and planning next steps',
-                'activities': [
-                    'Comprehensive reflection on learning journey',
-                    'Assessment of growth and change',
-                    'Identification of new questions and directions'
-                ],
-                'duration': '1 week'
-            }
-        ]
+        experience = profile.get('experience_level')
+        motivation = profile.get('motivation_level')
         
-        # Adjust stages based on readiness level
-        if readiness_level == 'beginner':
-            # Add more scaffolding and support
-            for stage in base_stages:
-                stage['support_level'] = 'high'
-                stage['scaffolding'] = 'extensive'
-        elif readiness_level == 'advanced':
-            # Increase complexity and independence
-            for stage in base_stages:
-                stage['complexity'] = 'high'
-                stage['independence'] = 'maximum'
-        
-        return base_stages
-    
-    def _design_assessments(self, topic: str, stages: List[Dict[str, Any]], context: LearningContext) -> List[Dict[str, Any]]:
+        # Only strings can match a level; anything else, including unhashable
+        # lists and dicts, reads as beginner experience and medium motivation
+        experience_index = _EXPERIENCE_INDEX.get(experience, 0) if isinstance(experience, str) else 0
+        motivation_index = _MOTIVATION_INDEX.get(motivation, 1) if isinstance(motivation, str) else 1
+        return _READINESS_TABLE[experience_index][motivation_index]
+    
+    def _design_learning_stages(self, topic: str, readiness_level: ReadinessLevel, context: LearningContext) -> Tuple[Dict[str, Any], ...]:
+        """Design progressive learning stages"""
+        return _plain_dicts(_STAGE_VARIANTS.get(readiness_level, _BASE_STAGES))
+    
+    def _design_assessments(self, topic: str, stages: Sequence[Mapping[str, Any]], context: LearningContext) -> Tuple[Dict[str, Any], ...]:
         """Design assessment strategies for learning pathway"""
-        assessments = [
-            {
-                'name': 'Inquiry Portfolio',
-                'description': 'Collection of questions, explorations, and reflections',
-                'type': 'formative',
-                'frequency': 'ongoing'
-            },
-            {
-                'name': 'Perspective Analysis',
-                'description': 'Demonstration of multi-perspective understanding',
-                'type': 'formative',
-                'frequency': 'mid-pathway'
-            },
-            {
-                'name': 'Synthesis Project',
-                'description': 'Creative integration of learning into meaningful output',
-                'type': 'summative',
-                'frequency': 'end of pathway'
-            },
-            {
-                'name': 'Learning Reflection',
-                'description': 'Deep reflection on transformation and growth',
-                'type': 'reflective',
-                'frequency': 'end of pathway'
-            }
-        ]
-        return assessments
+        return _plain_dicts(_ASSESSMENTS)
     
-    def _recommend_resources(self, topic: str, profile: Dict[str, Any], context: LearningContext) -> List[Dict[str, str]]:
+    def _recommend_resources(self, topic: str, profile: Dict[str, Any], context: LearningContext) -> Tuple[Dict[str, str], ...]:
         """Recommend learning resources"""
-        resources = [
-            {
-                'type': 'books',
-                'recommendations': 'Foundational texts and diverse perspectives on the topic',
-                'purpose': 'Building knowledge base and exposure to different viewpoints'
-            },
-            {
-                'type': 'experts',
-                'recommendations': 'Practitioners, researchers, and thought leaders in the field',
-                'purpose': 'Learning from experience and current thinking'
-            },
-            {
-                'type': 'communities',
-                'recommendations': 'Learning communities and discussion groups',
-                'purpose': 'Dialogue and collaborative exploration'
-            },
-            {
-                'type': 'experiences',
-                'recommendations': 'Direct experiences and immersive opportunities',
-                'purpose': 'Embodied learning and practical understanding'
-            }
-        ]
-        return resources
+        return _plain_dicts(_RESOURCES)
     
-    def _design_reflection_protocols(self, topic: str, stages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _design_reflection_protocols(self, topic: str, stages: Sequence[Mapping[str, Any]]) -> Tuple[Dict[str, Any], ...]:
         """Design reflection protocols for each stage"""
-        protocols = [
-            {
-                'stage': 'weekly',
-                'questions': [
-                    'What new questions emerged this week?',
-                    'How has my understanding shifted?',
-                    'What challenged my assumptions?',
-                    'What do I want to explore next?'
-                ]
-            },
-            {
-                'stage': 'milestone',
-                'questions': [
-                    'How has my relationship to this topic evolved?',
-                    'What patterns am I beginning to see?',
-                    'Where am I feeling stuck, and what might help?',
-                    'How is this learning connecting to other areas of my life?'
-                ]
-            },
-            {
-                'stage': 'completion',
-                'questions': [
-                    'What are the most significant insights from this learning journey?',
-                    'How have I changed as a result of this exploration?',
-                    'What questions will I continue to carry forward?',
-                    'How will I apply what I\'ve learned?'
-                ]
-            }
-        ]
-        return protocols
+        return _plain_dicts(_REFLECTION_PROTOCOLS)
     
-    def _define_success_indicators(self, topic: str, context: LearningContext) -> List[str]:
+    def _define_success_indicators(self, topic: str, context: LearningContext) -> Tuple[str, ...]:
         """Define indicators of successful learning"""
-        indicators = [
-            'Ability to ask increasingly sophisticated questions about the topic',
-            'Demonstration of multi-perspective understanding',
-            'Evidence of personal transformation or growth',
-            'Application of insights in real-world contexts',
-            'Continued curiosity and motivation for further learning',
-            'Contribution to others\' learning and understanding'
-        ]
-        return indicators
+        return _SUCCESS_INDICATORS
     
-    def _display_pathway_design(self, pathway: Dict[str, Any]):
+    def _display_pathway_design(self, pathway: Dict[str, Any], lines: List[str]):
         """Display formatted pathway design"""
-        print(f"\n📋 LEARNING PATHWAY DESIGN RESULTS")
-        print("=" * 60)
-        print(f"🎯 Topic: {pathway['topic']}")
-        print(f"📊 Readiness Level: {pathway['readiness_level'].upper()}")
-        print(f"⏰ Estimated Duration: {pathway['estimated_duration']}")
-        
-        print(f"\n🛤️ LEARNING STAGES:")
-        for i, stage in enumerate(pathway['learning_stages'], 1):
-            print(f"   {i}. {stage['name']} ({stage['duration']})")
-            print(f"      Focus: {stage['focus']}")
-    
-    def _initialize_pathway_templates(self) -> Dict[str, Any]:
-        """Initialize pathway design templates"""
-        return {
-            'stages': ['exploration', 'inquiry', 'synthesis', 'application', 'reflection'],
-            'activities': ['questioning', 'research', 'dialogue', 'experimentation', 'reflection'],
-            'assessments': ['portfolio', 'project', 'presentation', 'reflection', 'peer_feedback']
-        }
-    
-    def _initialize_assessment_strategies(self) -> Dict[str, List[str]]:
-        """Initialize assessment strategy templates"""
-        return {
-            'formative': ['ongoing questions', 'learning journal', 'peer dialogue', 'mentor check-ins'],
-            'summative': ['synthesis project', 'presentation', 'portfolio', 'reflection essay'],
-            'authentic': ['real-world application', 'community contribution', 'mentoring others']
-        }
+        stages = "".join(
+            f"\n   {i}. {stage['name']} ({stage['duration']})"
+            f"\n      Focus: {stage['focus']}"
+            for i, stage in enumerate(pathway['learning_stages'], 1)
+        )
+        lines.append(
+            f"\n📋 LEARNING PATHWAY DESIGN RESULTS\n"
+            f"{_SEP60}\n"
+            f"🎯 Topic: {pathway['topic']}\n"
+            f"📊 Readiness Level: {pathway['readiness_level'].upper()}\n"
+            f"⏰ Estimated Duration: {pathway['estimated_duration']}\n"
+            f"\n🛤️ LEARNING STAGES:{stages}"
+        )
 
 
 def demonstrate_inquiry_applications():
     """
     Comprehensive demonstration of Inquiry Methodology Framework applications.
     """
-    print("❓ INQUIRY METHODOLOGY FRAMEWORK - COMPREHENSIVE DEMONSTRATION")
-    print("=" * 80)
+    _write_lines(("❓ INQUIRY METHODOLOGY FRAMEWORK - COMPREHENSIVE DEMONSTRATION", _SEP80))
     
     # Initialize frameworks
     inquiry_generator = InquiryGenerator()
@@ -968,8 +1295,7 @@ def demonstrate_inquiry_applications():
     pathway_designer = LearningPathwayDesigner()
     
     # Demonstration 1: Educational Context
-    print("\n📚 DEMONSTRATION 1: EDUCATIONAL INQUIRY SEQUENCE")
-    print("-" * 60)
+    _write_lines(("\n📚 DEMONSTRATION 1: EDUCATIONAL INQUIRY SEQUENCE", _DASH60))
     topic1 = "Artificial Intelligence in Education"
     inquiry_result = inquiry_generator.generate_inquiry_sequence(
         topic1, 
@@ -978,8 +1304,7 @@ def demonstrate_inquiry_applications():
     )
     
     # Demonstration 2: Organizational Context  
-    print("\n🏢 DEMONSTRATION 2: ORGANIZATIONAL PERSPECTIVE ROTATION")
-    print("-" * 60)
+    _write_lines(("\n🏢 DEMONSTRATION 2: ORGANIZATIONAL PERSPECTIVE ROTATION", _DASH60))
     topic2 = "Remote Work Culture Transformation"
     perspective_result = perspective_rotator.rotate_perspectives(
         topic2,
@@ -988,8 +1313,7 @@ def demonstrate_inquiry_applications():
     )
     
     # Demonstration 3: Personal Learning Pathway
-    print("\n👤 DEMONSTRATION 3: PERSONAL LEARNING PATHWAY DESIGN")
-    print("-" * 60)
+    _write_lines(("\n👤 DEMONSTRATION 3: PERSONAL LEARNING PATHWAY DESIGN", _DASH60))
     topic3 = "Sustainable Living Practices"
     learner_profile = {
         'experience_level': 'intermediate',
@@ -1004,9 +1328,11 @@ def demonstrate_inquiry_applications():
         context=LearningContext.PERSONAL
     )
     
-    print("\n✅ DEMONSTRATION COMPLETE")
-    print("The Inquiry Methodology Framework provides comprehensive tools for transformative")
-    print("question-based learning across personal, educational, organizational, and social contexts.")
+    _write_lines((
+        "\n✅ DEMONSTRATION COMPLETE",
+        "The Inquiry Methodology Framework provides comprehensive tools for transformative",
+        "question-based learning across personal, educational, organizational, and social contexts."
+    ))
 
 
 if __name__ == "__main__":
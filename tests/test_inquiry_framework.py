@@ -0,0 +1,226 @@
+"""
+Tests for the Inquiry Methodology Framework core implementation.
+"""
+
+import copy
+import json
+import pickle
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import inquiry_framework
+from inquiry_framework import (
+    InquiryGenerator, LearningContext, LearningPathwayDesigner, PerspectiveRotator, _json_default
+)
+
+
+LEARNER_PROFILE = {
+    'experience_level': 'intermediate',
+    'motivation_level': 'high',
+    'time_available': 'moderate',
+    'learning_style': 'experiential',
+    'goals': ['personal transformation', 'community impact']
+}
+
+
+def _design_pathway(topic="Sustainable Living Practices", profile=LEARNER_PROFILE):
+    designer = LearningPathwayDesigner()
+    return designer.design_learning_pathway(
+        topic, profile, context=LearningContext.PERSONAL, verbose=False
+    )
+
+
+def test_pathway_is_json_serializable():
+    pathway = _design_pathway()
+    decoded = json.loads(json.dumps(pathway))
+    assert decoded['learning_stages'][0]['name'] == 'Exploration and Orientation'
+
+
+def test_pathway_can_be_deep_copied_and_pickled():
+    pathway = _design_pathway()
+    assert copy.deepcopy(pathway) == pathway
+    assert pickle.loads(pickle.dumps(pathway)) == pathway
+
+
+def test_pathway_changes_do_not_leak_into_later_pathways():
+    pathway = _design_pathway()
+    pathway['learning_stages'][0]['notes'] = 'revisit'
+    assert 'notes' not in _design_pathway()['learning_stages'][0]
+
+
+def test_non_string_profile_levels_fall_back_to_defaults():
+    profile = {'experience_level': ['advanced'], 'motivation_level': {'level': 'high'}}
+    assert _design_pathway(profile=profile)['readiness_level'] == 'beginner'
+
+
+def test_pathway_readiness_level_is_a_lowercase_string():
+    profile = {'experience_level': 'advanced', 'motivation_level': 'high'}
+    pathway = _design_pathway(profile=profile)
+    assert pathway['readiness_level'] == 'advanced'
+    assert json.loads(json.dumps(pathway))['readiness_level'] == 'advanced'
+
+
+def _generate_sequence(generator, topic="AI", context=LearningContext.EDUCATIONAL, depth=2):
+    return generator.generate_inquiry_sequence(topic, context=context, depth=depth, verbose=False)
+
+
+def test_sequence_fields_are_read_only_and_cached_results_unchanged():
+    generator = InquiryGenerator()
+    result = _generate_sequence(generator)
+    for name in result._fields:
+        with pytest.raises(AttributeError):
+            setattr(result, name, ())
+        with pytest.raises(AttributeError):
+            delattr(result, name)
+    assert len(_generate_sequence(generator).essential_questions) == 2
+
+
+def test_question_and_history_contexts_are_plain_strings():
+    generator = InquiryGenerator()
+    result = _generate_sequence(generator, context=LearningContext.SOCIAL)
+    questions = [*result.essential_questions, *result.practical_applications,
+                 *result.depth_progression['surface']]
+    questions.extend(question for pair in result.dialectical_pairs for question in pair)
+    assert {type(question.context) for question in questions} == {str}
+    assert {question.context for question in questions} == {'social'}
+    assert str(questions[0].context) == 'social'
+    
+    rotator = PerspectiveRotator()
+    rotator.rotate_perspectives("Remote work", context=LearningContext.SOCIAL, verbose=False)
+    for record in (generator.inquiry_history[0], rotator.rotation_history[0]):
+        assert type(record['context']) is str and record['context'] == 'social'
+
+
+def test_sequence_cache_hit_returns_equal_result():
+    generator = InquiryGenerator()
+    first = _generate_sequence(generator)
+    again = _generate_sequence(generator)
+    assert again is first
+    assert again == _generate_sequence(InquiryGenerator())
+    assert again != _generate_sequence(generator, topic="Climate")
+
+
+def test_sequence_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(InquiryGenerator, '_sequence_cache_size', 2)
+    generator = InquiryGenerator()
+    hot = _generate_sequence(generator, topic="hot")
+    _generate_sequence(generator, topic="a")
+    assert _generate_sequence(generator, topic="hot") is hot
+    _generate_sequence(generator, topic="b")
+    assert _generate_sequence(generator, topic="hot") is hot
+    assert len(generator._sequence_cache) == 2
+
+
+def test_quiet_calls_write_nothing(capsys):
+    _generate_sequence(InquiryGenerator())
+    PerspectiveRotator().rotate_perspectives("Remote work", verbose=False)
+    _design_pathway()
+    assert capsys.readouterr().out == ""
+
+
+def test_concurrent_calls_on_one_generator_write_whole_blocks(capsys):
+    generator = InquiryGenerator()
+    topics = [f"Topic {i}" for i in range(8)]
+    expected = {}
+    for topic in topics:
+        generator.generate_inquiry_sequence(topic, depth=2)
+        expected[topic] = capsys.readouterr().out
+    
+    barrier = threading.Barrier(len(topics))
+    
+    def generate(topic):
+        barrier.wait()
+        generator.generate_inquiry_sequence(topic, depth=2)
+    
+    threads = [threading.Thread(target=generate, args=(topic,)) for topic in topics]
+    # Switch threads as often as possible so overlapping calls interleave
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    
+    out = capsys.readouterr().out
+    assert len(out) == sum(len(block) for block in expected.values())
+    for block in expected.values():
+        assert block in out
+
+
+def test_history_snapshot_is_read_only_and_survives_clear_history():
+    generator = InquiryGenerator()
+    for topic in ("AI", "Climate", "Cities"):
+        _generate_sequence(generator, topic=topic)
+    
+    snapshot = generator.inquiry_history
+    assert len(snapshot) == 3
+    assert snapshot[-1]['result']['topic'] == "Cities"
+    assert [record['result']['topic'] for record in snapshot[:2]] == ["AI", "Climate"]
+    assert snapshot == generator.to_records()
+    with pytest.raises(AttributeError):
+        snapshot.append({})
+    
+    _generate_sequence(generator, topic="Oceans")
+    assert len(snapshot) == 3
+    
+    generator.clear_history()
+    assert len(generator.inquiry_history) == 0
+    assert generator.to_records() == []
+    assert len(snapshot) == 3
+    assert snapshot[0]['result']['topic'] == "AI"
+
+
+def test_rotation_history_records_and_clears():
+    rotator = PerspectiveRotator()
+    rotator.rotate_perspectives("Remote work", stakeholders=3, verbose=False)
+    record = rotator.rotation_history[0]
+    assert record['result']['topic'] == "Remote work"
+    assert len(record['result']['perspectives']) == 3
+    rotator.clear_history()
+    assert len(rotator.rotation_history) == 0
+
+
+def test_export_history_backends_produce_the_same_json(monkeypatch):
+    pytest.importorskip("orjson")
+    generator = InquiryGenerator()
+    _generate_sequence(generator, topic="Éducation")
+    rotator = PerspectiveRotator()
+    rotator.rotate_perspectives("Remote work", verbose=False)
+    
+    for framework in (generator, rotator):
+        with_orjson = framework.export_history()
+        monkeypatch.setattr(inquiry_framework, '_load_orjson', lambda: None)
+        with_stdlib = framework.export_history()
+        monkeypatch.undo()
+        
+        assert with_orjson == with_stdlib
+        assert json.loads(with_stdlib) == json.loads(json.dumps(framework.to_records(), default=_json_default))
+
+
+def test_results_and_generators_round_trip_through_pickle_and_deepcopy():
+    generator = InquiryGenerator()
+    result = _generate_sequence(generator)
+    
+    for restored in (pickle.loads(pickle.dumps(result)), copy.deepcopy(result)):
+        assert restored == result
+        assert restored.topic == result.topic
+        assert dict(restored.depth_progression) == dict(result.depth_progression)
+        with pytest.raises(AttributeError):
+            restored.essential_questions = ()
+    
+    restored_generator = pickle.loads(pickle.dumps(generator))
+    assert restored_generator.inquiry_history == generator.inquiry_history
+    assert _generate_sequence(restored_generator) == result
+    
+    rotator = PerspectiveRotator()
+    rotator.rotate_perspectives("Remote work", verbose=False)
+    assert pickle.loads(pickle.dumps(rotator)).rotation_history == rotator.rotation_history
+    pickle.loads(pickle.dumps(LearningPathwayDesigner()))
\ No newline at end of file